@@ -32,7 +32,9 @@ DATABASE_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 # ============================================================
 # SEGURIDAD
 # ============================================================
-BCRYPT_WORK_FACTOR: int = 12
+# Costo de bcrypt: entero fijo, o "auto" para calibrar según el CPU
+# al primer import de utils.encryption (mayor costo con latencia < 250ms)
+BCRYPT_WORK_FACTOR: int | str = 12
 MAX_LOGIN_ATTEMPTS: int = 3
 LOCKOUT_DURATION_MINUTES: int = 15
 SESSION_TIMEOUT_MINUTES: int = 480  # 8 horas
@@ -65,6 +67,11 @@ PAGINATION_SIZE: int = 50  # registros por página
 # IMPORTACIÓN DE ARCHIVOS
 # ============================================================
 ALLOWED_EXTENSIONS: list[str] = [".xlsx", ".xls"]
+
+# Motor de lectura para .xlsx: "auto" usa calamine (Rust, varias veces
+# más rápido) si está instalado y cae a openpyxl si no;
+# "calamine"/"openpyxl" lo fijan explícitamente. Para .xls siempre xlrd.
+EXCEL_ENGINE: str = "auto"
 MAX_IMPORT_ROWS: int = 10000
 PREVIEW_ROWS: int = 10
 
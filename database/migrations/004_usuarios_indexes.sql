@@ -0,0 +1,9 @@
+-- ========================================================================
+-- S.C.A.H. - Migración 004: Índices de rendimiento para usuarios
+-- ========================================================================
+-- username ya está cubierto por el autoindex del UNIQUE y por
+-- idx_usuarios_username (migración 001); solo falta el índice
+-- compuesto para que el listado WHERE activo=1 ORDER BY
+-- nombre_completo use el índice sin paso de ordenamiento.
+
+CREATE INDEX IF NOT EXISTS idx_usuarios_activo_nombre ON usuarios(activo, nombre_completo);
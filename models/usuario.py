@@ -4,10 +4,11 @@ Define el modelo Pydantic para validación y las operaciones
 de base de datos para la tabla 'usuarios'.
 """
 
+import sqlite3
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from config.database import get_connection, get_transaction
 from config.settings import ROLES_USUARIO
@@ -15,6 +16,14 @@ from utils.logger import get_logger
 
 logger = get_logger("models.usuario")
 
+# RETURNING está disponible desde SQLite 3.35 (2021); se verifica una vez
+# al importar para conservar el camino de dos sentencias como fallback
+_SUPPORTS_RETURNING: bool = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Membresía O(1) para el validador de rol (ROLES_USUARIO es lista por
+# ser fuente de comboboxes ordenados en la UI)
+_ROLES_VALIDOS: frozenset[str] = frozenset(ROLES_USUARIO)
+
 
 # ============================================================
 # MODELO PYDANTIC
@@ -32,7 +41,7 @@ class UsuarioSchema(BaseModel):
     @classmethod
     def validar_rol(cls, v: str) -> str:
         """Valida que el rol sea uno de los permitidos."""
-        if v not in ROLES_USUARIO:
+        if v not in _ROLES_VALIDOS:
             raise ValueError(f"Rol inválido. Permitidos: {', '.join(ROLES_USUARIO)}")
         return v
 
@@ -43,6 +52,24 @@ class UsuarioSchema(BaseModel):
         return v.strip().lower()
 
 
+# Adaptador con el schema compilado una sola vez: validar dicts con
+# _USUARIO_ADAPTER.validate_python(data) usa el fastpath del core Rust
+# de Pydantic v2 en lugar del procesamiento de kwargs de UsuarioSchema(**data)
+_USUARIO_ADAPTER: TypeAdapter[UsuarioSchema] = TypeAdapter(UsuarioSchema)
+
+
+def validar_usuario(data: dict) -> UsuarioSchema:
+    """Valida datos de usuario reutilizando el schema ya compilado.
+
+    Args:
+        data: Diccionario con los campos de usuario.
+
+    Returns:
+        Instancia de UsuarioSchema validada.
+    """
+    return _USUARIO_ADAPTER.validate_python(data)
+
+
 # ============================================================
 # DAO - DATA ACCESS OBJECT
 # ============================================================
@@ -75,37 +102,83 @@ class UsuarioDAO:
             return user_id
 
     @staticmethod
-    def obtener_por_username(username: str) -> Optional[dict]:
+    def to_dict(row: sqlite3.Row) -> dict:
+        """Materializa una fila de usuario como diccionario mutable.
+
+        Las lecturas del DAO retornan sqlite3.Row (acceso por nombre o
+        posición sin copia); usar este helper solo cuando se necesite
+        mutar los datos, típicamente en el límite con la UI.
+
+        Args:
+            row: Fila retornada por una lectura del DAO.
+
+        Returns:
+            Diccionario con los datos de la fila.
+        """
+        return dict(row)
+
+    @staticmethod
+    def obtener_por_username(username: str) -> Optional[sqlite3.Row]:
         """Obtiene un usuario por su nombre de usuario.
 
         Args:
             username: Nombre de usuario a buscar.
 
         Returns:
-            Diccionario con datos del usuario o None si no existe.
+            Fila con datos del usuario (acceso por nombre) o None si no existe.
         """
         with get_connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM usuarios WHERE username = ?",
                 (username.strip().lower(),),
             )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return cursor.fetchone()
 
     @staticmethod
-    def obtener_por_id(user_id: int) -> Optional[dict]:
+    def obtener_por_usernames(usernames: list[str]) -> dict[str, sqlite3.Row]:
+        """Obtiene varios usuarios en una sola consulta.
+
+        Evita N viajes a la base cuando se necesitan múltiples usuarios
+        (p. ej. panel de administración con selección múltiple).
+
+        Args:
+            usernames: Nombres de usuario a buscar.
+
+        Returns:
+            Diccionario {username: fila} con los usuarios encontrados.
+        """
+        if not usernames:
+            return {}
+
+        normalizados = [u.strip().lower() for u in usernames]
+        resultado: dict[str, sqlite3.Row] = {}
+        # SQLite limita los parámetros por sentencia (999 en builds viejos)
+        lote_max = 999
+        with get_connection() as conn:
+            for i in range(0, len(normalizados), lote_max):
+                lote = normalizados[i:i + lote_max]
+                placeholders = ",".join("?" * len(lote))
+                cursor = conn.execute(
+                    f"SELECT * FROM usuarios WHERE username IN ({placeholders})",
+                    lote,
+                )
+                for row in cursor.fetchall():
+                    resultado[row["username"]] = row
+        return resultado
+
+    @staticmethod
+    def obtener_por_id(user_id: int) -> Optional[sqlite3.Row]:
         """Obtiene un usuario por su ID.
 
         Args:
             user_id: ID del usuario.
 
         Returns:
-            Diccionario con datos del usuario o None.
+            Fila con datos del usuario (acceso por nombre) o None.
         """
         with get_connection() as conn:
             cursor = conn.execute("SELECT * FROM usuarios WHERE id = ?", (user_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return cursor.fetchone()
 
     @staticmethod
     def actualizar_ultimo_acceso(username: str) -> None:
@@ -131,16 +204,24 @@ class UsuarioDAO:
             Número actual de intentos fallidos.
         """
         with get_transaction() as conn:
-            conn.execute(
-                "UPDATE usuarios SET intentos_fallidos = intentos_fallidos + 1 "
-                "WHERE username = ?",
-                (username.strip().lower(),),
-            )
-            cursor = conn.execute(
-                "SELECT intentos_fallidos FROM usuarios WHERE username = ?",
-                (username.strip().lower(),),
-            )
-            row = cursor.fetchone()
+            if _SUPPORTS_RETURNING:
+                cursor = conn.execute(
+                    "UPDATE usuarios SET intentos_fallidos = intentos_fallidos + 1 "
+                    "WHERE username = ? RETURNING intentos_fallidos",
+                    (username.strip().lower(),),
+                )
+                row = cursor.fetchone()
+            else:
+                conn.execute(
+                    "UPDATE usuarios SET intentos_fallidos = intentos_fallidos + 1 "
+                    "WHERE username = ?",
+                    (username.strip().lower(),),
+                )
+                cursor = conn.execute(
+                    "SELECT intentos_fallidos FROM usuarios WHERE username = ?",
+                    (username.strip().lower(),),
+                )
+                row = cursor.fetchone()
             intentos = row["intentos_fallidos"] if row else 0
             logger.warning("Intento fallido para %s: %d intentos", username, intentos)
             return intentos
@@ -154,9 +235,11 @@ class UsuarioDAO:
             hasta: Fecha/hora hasta la que estará bloqueada.
         """
         with get_transaction() as conn:
+            # isoformat está implementado en C y produce el mismo formato
+            # que strftime("%Y-%m-%d %H:%M:%S") sin parsear el spec
             conn.execute(
                 "UPDATE usuarios SET bloqueado_hasta = ? WHERE username = ?",
-                (hasta.strftime("%Y-%m-%d %H:%M:%S"), username.strip().lower()),
+                (hasta.isoformat(" ", "seconds"), username.strip().lower()),
             )
             logger.warning("Cuenta bloqueada: %s hasta %s", username, hasta)
 
@@ -175,14 +258,14 @@ class UsuarioDAO:
             )
 
     @staticmethod
-    def listar_todos(incluir_inactivos: bool = False) -> list[dict]:
+    def listar_todos(incluir_inactivos: bool = False) -> list[sqlite3.Row]:
         """Lista todos los usuarios del sistema.
 
         Args:
             incluir_inactivos: Si True, incluye usuarios desactivados.
 
         Returns:
-            Lista de diccionarios con datos de usuarios.
+            Lista de filas con datos de usuarios (acceso por nombre).
         """
         with get_connection() as conn:
             query = (
@@ -193,7 +276,9 @@ class UsuarioDAO:
                 query += " WHERE activo = 1"
             query += " ORDER BY nombre_completo"
             cursor = conn.execute(query)
-            return [dict(row) for row in cursor.fetchall()]
+            # fetchall materializa en C; la conversión a dict por fila
+            # duplicaba memoria y trabajo sin aportar nada a los callers
+            return cursor.fetchall()
 
     @staticmethod
     def existe_username(username: str) -> bool:
@@ -207,10 +292,10 @@ class UsuarioDAO:
         """
         with get_connection() as conn:
             cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM usuarios WHERE username = ?",
+                "SELECT 1 FROM usuarios WHERE username = ? LIMIT 1",
                 (username.strip().lower(),),
             )
-            return cursor.fetchone()["count"] > 0
+            return cursor.fetchone() is not None
 
     @staticmethod
     def actualizar(
@@ -2,8 +2,17 @@
 
 Proporciona hashing seguro de contraseñas con bcrypt
 y funciones auxiliares de seguridad.
+
+Nota de seguridad: toda comparación de contraseñas/hashes debe hacerse
+con `verify_password` (bcrypt.checkpw compara en tiempo constante) o con
+`secure_equals` para tokens de sesión u otros secretos. Nunca usar `==`
+directamente: la comparación de strings corta en el primer byte distinto
+y filtra información de timing.
 """
 
+import hmac
+import time
+
 import bcrypt
 
 from config.settings import BCRYPT_WORK_FACTOR
@@ -11,6 +20,57 @@ from utils.logger import get_logger
 
 logger = get_logger("encryption")
 
+# Latencia objetivo por hash al autocalibrar el costo de bcrypt
+_CALIBRATION_TARGET_SECONDS: float = 0.25
+
+# Caracteres especiales aceptados en contraseñas; frozenset para
+# membresía O(1) (el `in` sobre un str escanea linealmente)
+_SPECIAL_CHARS_DISPLAY: str = "!@#$%^&*.,_-"
+_SPECIAL_CHARS: frozenset[str] = frozenset(_SPECIAL_CHARS_DISPLAY)
+
+
+def _calibrate_work_factor(target: float = _CALIBRATION_TARGET_SECONDS) -> int:
+    """Selecciona el mayor costo de bcrypt que no supere la latencia objetivo.
+
+    El costo de bcrypt escala exponencialmente: un valor fijo en settings
+    puede ser demasiado lento en hardware modesto o demasiado débil en
+    hardware rápido. Esta prueba mide en el CPU real y se detiene en el
+    primer costo que supera el objetivo.
+
+    Args:
+        target: Latencia máxima aceptable por hash, en segundos.
+
+    Returns:
+        Costo de bcrypt calibrado (entre 8 y 14).
+    """
+    chosen = 8
+    for cost in range(8, 15):
+        inicio = time.perf_counter()
+        bcrypt.hashpw(b"probe", bcrypt.gensalt(rounds=cost))
+        if time.perf_counter() - inicio > target:
+            break
+        chosen = cost
+    logger.info("Costo bcrypt autocalibrado: %d (objetivo %.0f ms)", chosen, target * 1000)
+    return chosen
+
+
+def _resolve_work_factor() -> int:
+    """Resuelve el costo de bcrypt efectivo a partir de la configuración.
+
+    Si BCRYPT_WORK_FACTOR es "auto", calibra según el CPU; de lo
+    contrario usa el valor fijo. Como efecto secundario, el hash de
+    prueba precalienta la librería de bcrypt antes del primer login real.
+    """
+    if BCRYPT_WORK_FACTOR == "auto":
+        return _calibrate_work_factor()
+    # Precalentar con el costo mínimo: carga las páginas de código/datos
+    # de la librería sin el costo de un hash completo
+    bcrypt.hashpw(b"warmup", bcrypt.gensalt(rounds=4))
+    return int(BCRYPT_WORK_FACTOR)
+
+
+_WORK_FACTOR: int = _resolve_work_factor()
+
 
 def hash_password(password: str) -> str:
     """Genera un hash bcrypt seguro para una contraseña.
@@ -30,9 +90,8 @@ def hash_password(password: str) -> str:
 
     try:
         password_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt(rounds=BCRYPT_WORK_FACTOR)
+        salt = bcrypt.gensalt(rounds=_WORK_FACTOR)
         hashed = bcrypt.hashpw(password_bytes, salt)
-        logger.debug("Contraseña hasheada exitosamente")
         return hashed.decode("utf-8")
     except Exception as e:
         logger.error("Error al hashear contraseña: %s", e)
@@ -58,9 +117,9 @@ def verify_password(password: str, password_hash: str) -> bool:
     try:
         password_bytes = password.encode("utf-8")
         hash_bytes = password_hash.encode("utf-8")
-        result = bcrypt.checkpw(password_bytes, hash_bytes)
-        logger.debug("Verificación de contraseña: %s", "exitosa" if result else "fallida")
-        return result
+        # Sin logging por llamada: el resultado lo registra auth_controller
+        # y este camino se ejecuta de forma síncrona durante el login
+        return bcrypt.checkpw(password_bytes, hash_bytes)
     except (ValueError, TypeError) as e:
         logger.warning("Error al verificar contraseña (formato inválido): %s", e)
         return False
@@ -69,6 +128,22 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
 
+def secure_equals(a: str, b: str) -> bool:
+    """Compara dos strings secretos en tiempo constante.
+
+    Usar para tokens de sesión, claves de API u otros secretos que no
+    pasen por bcrypt. Para contraseñas usar siempre `verify_password`.
+
+    Args:
+        a: Primer valor a comparar.
+        b: Segundo valor a comparar.
+
+    Returns:
+        True si ambos valores son idénticos.
+    """
+    return hmac.compare_digest(a.encode("utf-8"), b.encode("utf-8"))
+
+
 def validate_password_strength(password: str) -> tuple[bool, list[str]]:
     """Valida que una contraseña cumpla los requisitos mínimos de seguridad.
 
@@ -96,9 +171,10 @@ def validate_password_strength(password: str) -> tuple[bool, list[str]]:
     if not any(c.isdigit() for c in password):
         errors.append("Debe contener al menos un número")
 
-    special_chars = "!@#$%^&*.,_-"
-    if not any(c in special_chars for c in password):
-        errors.append(f"Debe contener al menos un carácter especial ({special_chars})")
+    if not any(c in _SPECIAL_CHARS for c in password):
+        errors.append(
+            f"Debe contener al menos un carácter especial ({_SPECIAL_CHARS_DISPLAY})"
+        )
 
     is_valid = len(errors) == 0
     if not is_valid:
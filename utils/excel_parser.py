@@ -4,22 +4,127 @@ Lee, mapea columnas automáticamente, valida filas y retorna datos
 listos para importar a la base de datos.
 """
 
-from datetime import date, datetime
+import functools
+import re
+import unicodedata
+from datetime import date
 from pathlib import Path
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from config.settings import COLUMNAS_IGNORAR, COLUMNAS_MAPEO, MAX_IMPORT_ROWS, PREVIEW_ROWS
+from config.settings import (
+    COLUMNAS_IGNORAR,
+    COLUMNAS_MAPEO,
+    EXCEL_ENGINE,
+    MAX_IMPORT_ROWS,
+)
 from utils.logger import get_logger
-from utils.validators import sanitizar_texto
+from utils.validators import sanitizar_texto_serie
 
 logger = get_logger("utils.excel_parser")
 
+# calamine (Rust) lee .xlsx en streaming varias veces más rápido que
+# openpyxl; se detecta una sola vez al importar
+try:
+    import python_calamine  # noqa: F401
+    _CALAMINE_DISPONIBLE = True
+except ImportError:
+    _CALAMINE_DISPONIBLE = False
+
+# Con pyarrow las columnas de texto se almacenan como buffers UTF-8
+# contiguos: las operaciones .str corren en C sin un PyObject por celda
+try:
+    import pyarrow  # noqa: F401
+    _PYARROW_DISPONIBLE = True
+except ImportError:
+    _PYARROW_DISPONIBLE = False
+
+
+def _resolver_engine_xlsx() -> str:
+    """Resuelve el engine de pandas para archivos .xlsx según EXCEL_ENGINE."""
+    if EXCEL_ENGINE == "calamine" or (EXCEL_ENGINE == "auto" and _CALAMINE_DISPONIBLE):
+        return "calamine"
+    return "openpyxl"
+
+
+# Caracteres que _normalize_header descarta, en una sola pasada de
+# translate en lugar de un replace encadenado por carácter
+_HDR_CLEAN_TABLE: dict[int, None] = str.maketrans("", "", ".°º")
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_header(text: str) -> str:
+    """Normaliza un nombre de columna removiendo acentos y caracteres especiales.
+
+    Memoizada: los encabezados y alias se repiten entre hojas y la
+    pasada NFKD es puro Python; el caché convierte las repeticiones en
+    un lookup de dict.
+    """
+    text = text.strip().lower().replace(" ", "_")
+    if text.isascii():
+        # Camino rápido: sin code points no ASCII, NFKD y el
+        # encode/decode son identidad y solo queda quitar puntos
+        return text.replace(".", "")
+    nfkd = unicodedata.normalize("NFKD", text)
+    ascii_text = nfkd.encode("ascii", "ignore").decode("ascii")
+    return ascii_text.translate(_HDR_CLEAN_TABLE)
+
+
+# Estructuras de mapeo precalculadas una sola vez al importar:
+# _auto_map_columns se llama por hoja y renormalizaba todos los alias
+# en cada llamada (O(hojas x campos x alias) pasadas NFKD).
+# Se preserva el orden de COLUMNAS_MAPEO porque define la prioridad
+# del matcheo codicioso (exacto y parcial).
+_FIELD_ALIASES_RAW: dict[str, frozenset[str]] = {
+    field: frozenset(aliases) for field, aliases in COLUMNAS_MAPEO.items()
+}
+_FIELD_ALIASES_NORM: dict[str, frozenset[str]] = {
+    field: frozenset(_normalize_header(a) for a in aliases)
+    for field, aliases in COLUMNAS_MAPEO.items()
+}
+# Alias largos (>= 5 chars normalizados) habilitados para matcheo parcial
+_FIELD_ALIASES_LARGOS: dict[str, tuple[str, ...]] = {
+    field: tuple(a for a in (_normalize_header(x) for x in aliases) if len(a) >= 5)
+    for field, aliases in COLUMNAS_MAPEO.items()
+}
+_IGNORAR_NORM: frozenset[str] = frozenset(_normalize_header(x) for x in COLUMNAS_IGNORAR)
+
+# Limpieza/clasificación de documentos: la tabla de translate quita los
+# separadores en una sola pasada C por string, sin entrar al motor de
+# regex; los patrones de clasificación sí se compilan una vez
+_DOC_CLEAN_TABLE: dict[int, None] = str.maketrans("", "", ".- ")
+_DNI_RE: re.Pattern[str] = re.compile(r"\d{7,8}")
+_PASAPORTE_RE: re.Pattern[str] = re.compile(r"[A-Z0-9]{5,15}")
+_DOC_ALNUM_RE: re.Pattern[str] = re.compile(r"[A-Za-z0-9]{5,15}")
+
+# Despacho de fechas escalares por regex: extraer grupos y construir
+# date() directo evita el setup/captura de ValueError de strptime por
+# cada formato que no matchea (la referencia \2 exige separador uniforme)
+_FECHA_ISO_RE: re.Pattern[str] = re.compile(r"(\d{4})([-/])(\d{1,2})\2(\d{1,2})")
+_FECHA_DMY_RE: re.Pattern[str] = re.compile(r"(\d{1,2})([./\-])(\d{1,2})\2(\d{4})")
+
 
 class ExcelParser:
     """Parser de archivos Excel con mapeo automático de columnas."""
 
+    # Formatos probados en orden, tanto por el camino escalar como por
+    # el vectorizado (el orden define la prioridad ante ambigüedad).
+    # %d/%m/%Y va primero: es el formato dominante en archivos locales,
+    # así la primera pasada vectorizada resuelve la mayoría de las
+    # celdas. No cambia ningún resultado porque los formatos año-primero
+    # y día-primero son disjuntos (4 dígitos al inicio vs al final) y el
+    # orden relativo día/mes vs mes/día se mantiene.
+    _DATE_FORMATS: tuple[str, ...] = (
+        "%d/%m/%Y",
+        "%Y-%m-%d",
+        "%d-%m-%Y",
+        "%d.%m.%Y",
+        "%m/%d/%Y",
+        "%Y/%m/%d",
+    )
+
     def __init__(self, file_path: Path, selected_sheets: Optional[list[str]] = None) -> None:
         """Inicializa el parser.
 
@@ -33,7 +138,10 @@ class ExcelParser:
         self._column_map: dict[str, str] = {}
         self._sheet_count: int = 0
         self._sheet_names: list[str] = []
-        self._raw_frames: list[pd.DataFrame] = []
+        # Copia cruda COMPLETA por hoja: la pestaña "Datos a Importar"
+        # pagina sobre todos los registros del archivo, no sobre una
+        # ventana fija (ver views/import_view.py)
+        self._raw_preview_rows: list[pd.DataFrame] = []
 
     @staticmethod
     def list_sheets(file_path: Path, only_numeric: bool = False) -> list[str]:
@@ -48,18 +156,23 @@ class ExcelParser:
         """
         file_path = Path(file_path)
         suffix = file_path.suffix.lower()
-        engine = "openpyxl" if suffix == ".xlsx" else "xlrd"
 
-        if engine == "xlrd":
+        if suffix != ".xlsx":
             import xlrd
             wb = xlrd.open_workbook(str(file_path), on_demand=True)
             all_names = wb.sheet_names()
             wb.release_resources()
         else:
-            from openpyxl import load_workbook
-            wb = load_workbook(str(file_path), read_only=True)
-            all_names = wb.sheetnames
-            wb.close()
+            # Un .xlsx es un zip: leer solo xl/workbook.xml evita que
+            # openpyxl parsee estilos y relaciones solo para los nombres
+            try:
+                all_names = ExcelParser._sheet_names_xlsx(file_path)
+            except Exception as e:
+                logger.debug("Peek de workbook.xml falló (%s), usando openpyxl", e)
+                from openpyxl import load_workbook
+                wb = load_workbook(str(file_path), read_only=True)
+                all_names = wb.sheetnames
+                wb.close()
 
         if only_numeric:
             # Filtrar solo hojas con nombre numérico
@@ -71,6 +184,50 @@ class ExcelParser:
         # Retornar todas las hojas en orden original
         return list(all_names)
 
+    @staticmethod
+    def _sheet_names_xlsx(file_path: Path) -> list[str]:
+        """Lee los nombres de hoja directamente de xl/workbook.xml.
+
+        Args:
+            file_path: Ruta al archivo .xlsx.
+
+        Returns:
+            Lista de nombres de hojas en el orden del workbook.
+        """
+        import zipfile
+        import xml.etree.ElementTree as ET
+
+        with zipfile.ZipFile(file_path) as z, z.open("xl/workbook.xml") as f:
+            root = ET.parse(f).getroot()
+        ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        return [s.attrib["name"] for s in root.findall(".//m:sheets/m:sheet", ns)]
+
+    @staticmethod
+    def _nonempty_row_mask(df: pd.DataFrame) -> np.ndarray:
+        """Máscara booleana de filas con al menos una celda no vacía.
+
+        Reemplaza el patrón `df.apply(..., axis=1)` (un frame de Python
+        por fila) por una reducción columna a columna: el trabajo de
+        strings queda en la capa C de pandas y en Python solo se itera
+        una vez por columna.
+
+        Args:
+            df: DataFrame a evaluar (se ignoran columnas internas `_*`).
+
+        Returns:
+            Array booleano con True en las filas no vacías.
+        """
+        mask = np.zeros(len(df), dtype=bool)
+        for col in df.columns:
+            if str(col).startswith("_"):
+                continue
+            # Cortocircuito: si ya no quedan filas por confirmar, las
+            # columnas restantes no pueden cambiar el resultado
+            if mask.all():
+                break
+            mask |= df[col].astype(str).str.strip().ne("").to_numpy()
+        return mask
+
     def parse(self) -> dict:
         """Lee y procesa el archivo Excel.
 
@@ -100,21 +257,28 @@ class ExcelParser:
             df = df.head(MAX_IMPORT_ROWS)
 
         # Columnas ya mapeadas por hoja en _read_file; solo log
-        logger.info("Mapeo de columnas consolidado: %s", self._column_map)
+        logger.debug("Mapeo de columnas consolidado: %s", self._column_map)
 
         # Procesar filas
         valid_rows: list[dict] = []
         errors: list[dict] = []
-        seen_docs: set[str] = set()
         duplicates: list[dict] = []
         skipped: int = 0
 
-        for idx, row in df.iterrows():
-            hoja = row.get("_hoja_origen", "")
-            fila = row.get("_fila_original", int(idx) + 2)
+        # Normalización vectorizada (columna a columna, en C) antes del
+        # paso residual por fila en Python
+        self._vectorize_frame(df)
+
+        # Hoists del loop caliente: método resuelto una vez y fecha de
+        # hoy calculada una vez por archivo en lugar de por fila
+        procesar = self._process_row
+        hoy = date.today()
+        for i, rec in enumerate(df.to_dict(orient="records")):
+            hoja = rec.get("_hoja_origen", "")
+            fila = rec.get("_fila_original", i + 2)
             row_label = f"Hoja '{hoja}' fila {fila}" if hoja else f"Fila {fila}"
             try:
-                data = self._process_row(row)
+                data = procesar(rec, hoy)
                 if not data:
                     skipped += 1
                     continue
@@ -123,28 +287,32 @@ class ExcelParser:
                 if hoja:
                     data["_hoja_origen"] = hoja
 
-                # Verificar duplicados dentro del archivo
-                doc_key = data.get("dni") or data.get("pasaporte") or ""
-                if doc_key and doc_key in seen_docs:
+                # Duplicados dentro del archivo: marca precalculada en
+                # _vectorize_frame sobre la clave de documento
+                if rec.get("_dup"):
                     duplicates.append({"row": row_label, **data})
                     continue
-                if doc_key:
-                    seen_docs.add(doc_key)
 
                 valid_rows.append(data)
 
             except Exception as e:
                 errors.append({"row": row_label, "error": str(e)})
 
-        # Construir raw_preview (datos crudos del Excel completos para vista previa)
+        # Construir raw_preview (datos crudos COMPLETOS del Excel): la
+        # vista de importación pagina sobre todos los registros y el
+        # contador "N registros del archivo" debe coincidir con ellos.
+        # concat asegura que cada registro lleve la unión de columnas de
+        # todas las hojas (la tabla de preview toma sus columnas del
+        # primer registro)
         raw_preview: list[dict] = []
-        if self._raw_frames:
-            try:
-                full_raw = pd.concat(self._raw_frames, ignore_index=True, sort=False)
-                full_raw = full_raw.fillna("")
-                raw_preview = full_raw.to_dict(orient="records")
-            except Exception:
-                raw_preview = []
+        try:
+            if self._raw_preview_rows:
+                combinado = pd.concat(
+                    self._raw_preview_rows, ignore_index=True, sort=False,
+                ).fillna("")
+                raw_preview = combinado.to_dict(orient="records")
+        except Exception:
+            raw_preview = []
 
         result = {
             "total_rows": total_rows,
@@ -177,16 +345,26 @@ class ExcelParser:
         """
         try:
             suffix = self._file_path.suffix.lower()
-            engine = "openpyxl" if suffix == ".xlsx" else "xlrd"
-
-            # Leer TODAS las hojas (sheet_name=None devuelve dict)
-            all_sheets = pd.read_excel(
-                self._file_path,
-                engine=engine,
-                dtype=str,
-                keep_default_na=False,
-                sheet_name=None,
-            )
+            engine = _resolver_engine_xlsx() if suffix == ".xlsx" else "xlrd"
+
+            if suffix == ".xlsx" and engine == "openpyxl":
+                # Sin calamine: leer en streaming read-only, que corta en
+                # MAX_IMPORT_ROWS durante la lectura en lugar de
+                # materializar hojas gigantes para truncarlas después
+                all_sheets = self._read_sheets_openpyxl_stream()
+            else:
+                # Leer TODAS las hojas (sheet_name=None devuelve dict).
+                # nrows acota cada hoja al límite de importación; con
+                # calamine el recorte ocurre durante la lectura misma
+                # (file_rows_needed), no después de materializar todo
+                all_sheets = pd.read_excel(
+                    self._file_path,
+                    engine=engine,
+                    dtype=str,
+                    keep_default_na=False,
+                    sheet_name=None,
+                    nrows=MAX_IMPORT_ROWS,
+                )
 
             self._sheet_count = len(all_sheets)
             self._sheet_names = list(all_sheets.keys())
@@ -214,72 +392,32 @@ class ExcelParser:
 
             all_mappings: dict[str, str] = {}
             frames: list[pd.DataFrame] = []
-            self._raw_frames = []
-
-            for sheet_name, sheet_df in hojas_a_procesar.items():
-                if sheet_df.empty:
-                    logger.info("Hoja '%s' vacía, omitida", sheet_name)
-                    continue
-
-                # Limpiar nombres de columnas
-                sheet_df.columns = [
-                    str(col).strip().lower().replace(" ", "_")
-                    for col in sheet_df.columns
-                ]
-
-                # Eliminar filas completamente vacías
-                sheet_df = sheet_df.dropna(how="all")
-                sheet_df = sheet_df[
-                    sheet_df.astype(str).apply(
-                        lambda x: x.str.strip().str.len().sum(), axis=1,
-                    ) > 0
-                ]
+            self._raw_preview_rows = []
+
+            # Procesar hojas: en paralelo con hilos cuando hay varias
+            # (el trabajo de strings de pandas libera el GIL en C)
+            items = list(hojas_a_procesar.items())
+            if len(items) >= 4:
+                import os
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1),
+                ) as executor:
+                    resultados = list(
+                        executor.map(lambda it: self._process_sheet(*it), items),
+                    )
+            else:
+                resultados = [self._process_sheet(n, s) for n, s in items]
 
-                if sheet_df.empty:
+            # Ensamblar en el orden original de las hojas
+            for procesada, raw_head, sheet_map in resultados:
+                if procesada is None:
                     continue
-
-                # Mapear columnas POR HOJA para manejar nombres diferentes
-                sheet_cols = [c for c in sheet_df.columns.tolist() if not c.startswith("_")]
-                sheet_map = self._auto_map_columns(sheet_cols)
                 all_mappings.update(sheet_map)
-
-                # Guardar copia RAW con headers legibles (Title Case) para preview
-                import unicodedata
-
-                def _normalize_ignore(text: str) -> str:
-                    t = text.strip().lower().replace(" ", "_")
-                    nfkd = unicodedata.normalize("NFKD", t)
-                    return nfkd.encode("ascii", "ignore").decode("ascii").replace(".", "").replace("°", "").replace("º", "")
-
-                ignorar_norm = [_normalize_ignore(ig) for ig in COLUMNAS_IGNORAR]
-                # Columnas con nombre original legible, excluyendo las ignoradas y las internas
-                raw_cols = []
-                for c in sheet_df.columns:
-                    if c.startswith("_"):
-                        continue
-                    if _normalize_ignore(c) in ignorar_norm:
-                        continue
-                    raw_cols.append(c)
-                raw_copy = sheet_df[raw_cols].copy()
-                # Renombrar a Title Case legible: "apellido_y_nombre" → "Apellido Y Nombre"
-                raw_copy.columns = [
-                    str(c).replace("_", " ").strip().title() for c in raw_copy.columns
-                ]
-                # Agregar columna "Hoja" con el número de hoja de origen
-                raw_copy.insert(0, "Hoja", str(sheet_name))
-                self._raw_frames.append(raw_copy)
-
-                sheet_df = sheet_df.rename(columns=sheet_map)
-
-                sheet_df = sheet_df.copy()
-                sheet_df["_hoja_origen"] = str(sheet_name)
-                # Guardar número de fila original dentro de la hoja
-                sheet_df["_fila_original"] = range(2, len(sheet_df) + 2)
-                frames.append(sheet_df)
-                logger.info(
-                    "Hoja '%s': %d filas, %d columnas mapeadas",
-                    sheet_name, len(sheet_df), len(sheet_map),
-                )
+                if raw_head is not None:
+                    self._raw_preview_rows.append(raw_head)
+                frames.append(procesada)
 
             self._column_map = all_mappings
             self._sheet_count = len(frames)  # Solo hojas numéricas con datos
@@ -289,10 +427,38 @@ class ExcelParser:
                 logger.warning("Ninguna hoja contiene datos")
                 return pd.DataFrame()
 
-            # Concatenar todas las hojas
-            df = pd.concat(frames, ignore_index=True, sort=False)
-            # Rellenar NaN de columnas faltantes con cadena vacía
-            df = df.fillna("")
+            # Concatenar todas las hojas columna por columna con numpy:
+            # evita la consolidación del BlockManager de pd.concat y el
+            # fillna posterior (las columnas ausentes en una hoja se
+            # rellenan con "" al construir, no con NaN a posteriori)
+            union_cols = list(dict.fromkeys(c for f in frames for c in f.columns))
+            combinado: dict[str, np.ndarray] = {}
+            for col in union_cols:
+                partes = [
+                    f[col].to_numpy() if col in f.columns
+                    else np.full(len(f), "", dtype=object)
+                    for f in frames
+                ]
+                combinado[col] = np.concatenate(partes)
+            df = pd.DataFrame(combinado, copy=False)
+
+            # La hoja de origen tiene un puñado de valores únicos:
+            # como categoría son códigos int8 por fila en lugar de un
+            # string materializado por celda en el buffer Arrow
+            if "_hoja_origen" in df.columns:
+                df["_hoja_origen"] = df["_hoja_origen"].astype("category")
+
+            # Pasar el texto a dtype string respaldado por Arrow: menor
+            # memoria y .str vectorizado sin boxing de Python por celda
+            if _PYARROW_DISPONIBLE:
+                try:
+                    cols_texto = [
+                        c for c in df.columns
+                        if c not in ("_fila_original", "_hoja_origen")
+                    ]
+                    df[cols_texto] = df[cols_texto].astype("string[pyarrow]")
+                except Exception as e:
+                    logger.debug("No se pudo convertir a string[pyarrow]: %s", e)
 
             logger.info(
                 "Total combinado: %d filas de %d hojas",
@@ -304,60 +470,164 @@ class ExcelParser:
             logger.error("Error al leer archivo Excel: %s", e)
             raise ValueError(f"No se pudo leer el archivo: {e}") from e
 
-    def _auto_map_columns(self, file_columns: list[str]) -> dict[str, str]:
+    def _read_sheets_openpyxl_stream(self) -> dict[str, pd.DataFrame]:
+        """Lee las hojas de un .xlsx en streaming con openpyxl read-only.
+
+        A diferencia de pd.read_excel, el modo read-only itera filas sin
+        cargar la hoja completa en memoria, y el límite de filas se
+        aplica durante la lectura: las filas excedentes nunca se
+        materializan. Las celdas se convierten a string vacío/str() para
+        replicar dtype=str + keep_default_na=False.
+
+        Returns:
+            Diccionario {nombre_de_hoja: DataFrame} en orden del workbook.
+        """
+        from openpyxl import load_workbook
+
+        hojas: dict[str, pd.DataFrame] = {}
+        wb = load_workbook(self._file_path, read_only=True, data_only=True)
+        try:
+            for ws in wb.worksheets:
+                filas = ws.iter_rows(max_row=MAX_IMPORT_ROWS + 1, values_only=True)
+                header = next(filas, None)
+                if header is None:
+                    hojas[ws.title] = pd.DataFrame()
+                    continue
+                columnas = ["" if h is None else str(h) for h in header]
+                ncols = len(columnas)
+                datos: list[list[str]] = []
+                for fila in filas:
+                    valores = ["" if v is None else str(v) for v in fila[:ncols]]
+                    if len(valores) < ncols:
+                        valores.extend([""] * (ncols - len(valores)))
+                    datos.append(valores)
+                hojas[ws.title] = pd.DataFrame(datos, columns=columnas, dtype=object)
+        finally:
+            wb.close()
+        return hojas
+
+    def _process_sheet(
+        self, sheet_name: str, sheet_df: pd.DataFrame,
+    ) -> tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], dict[str, str]]:
+        """Limpia, filtra y mapea una hoja individual.
+
+        Args:
+            sheet_name: Nombre de la hoja.
+            sheet_df: DataFrame crudo de la hoja.
+
+        Returns:
+            Tupla (hoja procesada o None si está vacía, primeras filas
+            crudas para la vista previa o None, mapeo de columnas).
+        """
+        if sheet_df.empty:
+            logger.info("Hoja '%s' vacía, omitida", sheet_name)
+            return None, None, {}
+
+        # Una sola pasada por encabezado: nombre limpio, normalizado y
+        # versión legible (Title Case) se derivan juntos y se reutilizan
+        # en el filtrado de ignoradas y en la vista previa
+        col_info: list[tuple[str, str, str]] = []
+        for col in sheet_df.columns:
+            limpio = str(col).strip().lower().replace(" ", "_")
+            col_info.append((
+                limpio,
+                _normalize_header(limpio),
+                limpio.replace("_", " ").strip().title(),
+            ))
+        sheet_df.columns = [limpio for limpio, _, _ in col_info]
+
+        # Eliminar filas completamente vacías
+        sheet_df = sheet_df.dropna(how="all")
+        sheet_df = sheet_df[self._nonempty_row_mask(sheet_df)]
+
+        if sheet_df.empty:
+            return None, None, {}
+
+        # Mapear columnas POR HOJA para manejar nombres diferentes
+        sheet_cols = tuple(c for c in sheet_df.columns.tolist() if not c.startswith("_"))
+        # dict nuevo por hoja: el resultado cacheado es compartido y no
+        # debe mutarse aguas abajo
+        sheet_map = dict(self._auto_map_columns(sheet_cols))
+
+        # Guardar copia RAW con headers legibles (Title Case) para preview
+        # Columnas con nombre original legible, excluyendo las ignoradas y las internas
+        raw_cols: list[str] = []
+        titulos: list[str] = []
+        for limpio, norm, titulo in col_info:
+            if limpio.startswith("_") or norm in _IGNORAR_NORM:
+                continue
+            raw_cols.append(limpio)
+            titulos.append(titulo)
+        raw_copy = sheet_df[raw_cols].copy()
+        # Title Case legible: "apellido_y_nombre" → "Apellido Y Nombre"
+        raw_copy.columns = titulos
+        # Agregar columna "Hoja" con el número de hoja de origen
+        raw_copy.insert(0, "Hoja", str(sheet_name))
+
+        # Renombrar mutando solo el Index: a diferencia de rename, no
+        # construye otro DataFrame (los datos no se copian en ningún caso)
+        sheet_df.columns = [sheet_map.get(c, c) for c in sheet_df.columns]
+        sheet_df["_hoja_origen"] = str(sheet_name)
+        # Guardar número de fila original dentro de la hoja;
+        # np.arange evita materializar un PyLong por fila
+        sheet_df["_fila_original"] = np.arange(2, len(sheet_df) + 2, dtype=np.int32)
+        logger.info(
+            "Hoja '%s': %d filas, %d columnas mapeadas",
+            sheet_name, len(sheet_df), len(sheet_map),
+        )
+        return sheet_df, raw_copy, sheet_map
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _auto_map_columns(file_columns: tuple[str, ...]) -> dict[str, str]:
         """Mapea columnas del archivo a campos del sistema.
 
+        La detección depende solo de los nombres de columna, así que el
+        resultado se memoiza por firma de columnas: hojas con el mismo
+        encabezado (y re-importaciones del mismo archivo) resuelven el
+        mapeo una sola vez. El dict cacheado es compartido: los
+        llamadores deben copiarlo antes de mutarlo.
+
         Args:
             file_columns: Nombres de columnas del archivo.
 
         Returns:
             Mapeo {columna_archivo: campo_sistema}.
         """
-        import unicodedata
-
-        def normalize(text: str) -> str:
-            """Normaliza texto removiendo acentos y caracteres especiales."""
-            text = text.strip().lower().replace(" ", "_")
-            nfkd = unicodedata.normalize("NFKD", text)
-            ascii_text = nfkd.encode("ascii", "ignore").decode("ascii")
-            ascii_text = ascii_text.replace(".", "").replace("°", "").replace("º", "")
-            return ascii_text
-
         mapping: dict[str, str] = {}
         used_fields: set[str] = set()
 
-        # Normalizar lista de columnas a ignorar
-        ignorar_norm = [normalize(ig) for ig in COLUMNAS_IGNORAR]
+        # Normalizar cada columna una sola vez
+        cols_norm: dict[str, str] = {col: _normalize_header(col) for col in file_columns}
+        cols_clean: dict[str, str] = {
+            col: col.strip().lower().replace(" ", "_") for col in file_columns
+        }
 
         # Filtrar columnas que son contadores/numeradores
         cols_validas = []
         for col in file_columns:
-            col_norm = normalize(col)
-            if col_norm in ignorar_norm:
+            if cols_norm[col] in _IGNORAR_NORM:
                 logger.debug("Columna ignorada (contador): %s", col)
             else:
                 cols_validas.append(col)
 
-        for system_field, aliases in COLUMNAS_MAPEO.items():
-            normalized_aliases = [normalize(a) for a in aliases]
+        for system_field in COLUMNAS_MAPEO:
+            aliases_raw = _FIELD_ALIASES_RAW[system_field]
+            aliases_norm = _FIELD_ALIASES_NORM[system_field]
             for col in cols_validas:
                 if col in mapping:
                     continue
-                col_clean = col.strip().lower().replace(" ", "_")
-                col_normalized = normalize(col)
 
                 # Coincidencia exacta o normalizada
-                if col_clean in aliases or col_normalized in normalized_aliases:
+                if cols_clean[col] in aliases_raw or cols_norm[col] in aliases_norm:
                     mapping[col] = system_field
                     used_fields.add(system_field)
                     break
 
                 # Coincidencia parcial (solo con aliases de 5+ caracteres)
-                for alias in aliases:
-                    alias_norm = normalize(alias)
-                    if len(alias_norm) >= 5 and (
-                        alias_norm in col_normalized or col_normalized in alias_norm
-                    ):
+                col_normalized = cols_norm[col]
+                for alias_norm in _FIELD_ALIASES_LARGOS[system_field]:
+                    if alias_norm in col_normalized or col_normalized in alias_norm:
                         if system_field not in used_fields:
                             mapping[col] = system_field
                             used_fields.add(system_field)
@@ -365,17 +635,137 @@ class ExcelParser:
                 if system_field in used_fields:
                     break
 
-        logger.info("Columnas del archivo: %s", file_columns)
-        logger.info("Mapeo resultante: %s", mapping)
-        logger.info("Columnas no mapeadas: %s", [c for c in file_columns if c not in mapping])
+        # A DEBUG: formatear estas listas/dicts completos en cada
+        # importación es costo puro cuando el nivel efectivo es INFO
+        logger.debug("Columnas del archivo: %s", file_columns)
+        logger.debug("Mapeo resultante: %s", mapping)
+        logger.debug("Columnas no mapeadas: %s", [c for c in file_columns if c not in mapping])
 
         return mapping
 
-    def _process_row(self, row: pd.Series) -> Optional[dict]:
-        """Procesa una fila del DataFrame.
+    @staticmethod
+    def _vectorize_frame(df: pd.DataFrame) -> None:
+        """Precalcula en columnas auxiliares el trabajo repetitivo por fila.
+
+        Limpia y clasifica los documentos de todo el DataFrame con
+        operaciones `.str` vectorizadas (una pasada en C por columna) en
+        lugar de tres `str.replace` de Python por celda. `_process_row`
+        consume las columnas `_dni_clean`/`_dni_ok`/`_dni_alnum_ok` y
+        `_pas_clean`/`_pas_ok` resultantes.
+
+        Args:
+            df: DataFrame combinado; se modifica in-place.
+        """
+        # Un solo barrido de strip por columna: después de esto cada
+        # celda de datos es un string sin espacios en los bordes y el
+        # loop por fila puede leerlas con dict.get sin re-strip
+        for c in df.columns:
+            if not str(c).startswith("_"):
+                df[c] = df[c].astype(str).str.strip()
+
+        # Sanitización vectorizada de los campos que la requieren,
+        # compartida con la versión escalar de utils.validators
+        for c in ("apellido_nombre", "apellido", "nombre",
+                  "nacionalidad", "procedencia"):
+            if c in df.columns:
+                df[c] = sanitizar_texto_serie(df[c])
+
+        if "dni" in df.columns:
+            limpio = (
+                df["dni"].astype(str).str.strip()
+                .str.removesuffix(".0")  # fix float de Excel, antes de quitar puntos
+                .str.translate(_DOC_CLEAN_TABLE)
+            )
+            df["_dni_clean"] = limpio
+            df["_dni_ok"] = limpio.str.fullmatch(_DNI_RE).fillna(False)
+            # Columna combinada DNI/Pasaporte: candidato a pasaporte
+            df["_dni_alnum_ok"] = limpio.str.fullmatch(_DOC_ALNUM_RE).fillna(False)
+        if "pasaporte" in df.columns:
+            limpio_p = (
+                df["pasaporte"].astype(str).str.strip().str.upper()
+                .str.replace(" ", "", regex=False)
+            )
+            df["_pas_clean"] = limpio_p
+            df["_pas_ok"] = limpio_p.str.fullmatch(_PASAPORTE_RE).fillna(False)
+
+        # Fallback de documento: primera columna (en orden) con un número
+        # de 7-8 dígitos, coalescida en C en lugar del loop por celda
+        fallback = pd.Series("", index=df.index, dtype=object)
+        for c in list(df.columns):
+            if str(c).startswith("_"):
+                continue
+            cand = (
+                df[c].astype(str).str.strip()
+                .str.removesuffix(".0")
+                .str.translate(_DOC_CLEAN_TABLE)
+            )
+            ok = cand.str.fullmatch(_DNI_RE).fillna(False)
+            fallback = fallback.mask(fallback.eq("") & ok, cand)
+        df["_fallback_dni"] = fallback
+
+        # Clave de documento por fila (dni > pasaporte > pasaporte en
+        # columna combinada > fallback) y marca de duplicado dentro del
+        # archivo; duplicated() corre en C y reemplaza el set de Python
+        # del loop. Incluir el fallback es clave: en archivos sin columna
+        # dni mapeada es el único documento disponible. Matiz aceptado:
+        # duplicated() marca contra la primera aparición aunque esa fila
+        # luego termine en errores, mientras que el viejo set solo
+        # registraba filas que llegaban a válidas
+        doc_key = pd.Series("", index=df.index, dtype=object)
+        if "_dni_clean" in df.columns:
+            doc_key = doc_key.mask(df["_dni_ok"], df["_dni_clean"])
+        if "_pas_clean" in df.columns:
+            doc_key = doc_key.mask(doc_key.eq("") & df["_pas_ok"], df["_pas_clean"])
+        if "_dni_clean" in df.columns:
+            doc_key = doc_key.mask(
+                doc_key.eq("") & df["_dni_alnum_ok"], df["_dni_clean"].str.upper(),
+            )
+        doc_key = doc_key.mask(doc_key.eq("") & fallback.ne(""), fallback)
+        df["_doc_key"] = doc_key
+        df["_dup"] = doc_key.duplicated() & doc_key.ne("")
+
+        # Fechas: una llamada vectorizada por columna en lugar de hasta
+        # seis strptime de Python por celda
+        for col in ("fecha_entrada", "fecha_salida", "fecha_nacimiento"):
+            if col in df.columns:
+                df[f"_{col}_parsed"] = ExcelParser._parse_date_col(df[col])
+
+    @staticmethod
+    def _parse_date_col(series: pd.Series) -> pd.Series:
+        """Parsea una columna completa de fechas con pd.to_datetime.
+
+        Aplica los formatos de _DATE_FORMATS en orden sobre las celdas
+        aún no resueltas (misma prioridad que el camino escalar) y cierra
+        con un intento de inferencia para los restos.
+
+        Args:
+            series: Columna de strings con fechas.
+
+        Returns:
+            Serie de objetos date (NaT donde no se pudo parsear).
+        """
+        s = series.astype(str).str.strip()
+        resultado = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+        pendiente = s.ne("")
+        for fmt in ExcelParser._DATE_FORMATS:
+            if not pendiente.any():
+                break
+            intento = pd.to_datetime(s.where(pendiente), format=fmt, errors="coerce")
+            resultado = resultado.fillna(intento)
+            pendiente &= intento.isna()
+        if pendiente.any():
+            resultado = resultado.fillna(
+                pd.to_datetime(s.where(pendiente), errors="coerce"),
+            )
+        return resultado.dt.date
+
+    def _process_row(self, row: dict, hoy: Optional[date] = None) -> Optional[dict]:
+        """Procesa una fila ya convertida a diccionario.
 
         Args:
-            row: Serie de Pandas con datos de la fila.
+            row: Diccionario con datos de la fila (salida de to_dict).
+            hoy: Fecha de hoy precalculada por parse() (default para
+                fecha_entrada); si es None se calcula aquí.
 
         Returns:
             Diccionario con datos procesados o None si la fila es inválida.
@@ -383,19 +773,19 @@ class ExcelParser:
         data: dict[str, Any] = {}
 
         # Campo combinado "APELLIDO Y NOMBRE" → dividir en apellido + nombre
-        apellido_nombre_val = self._get_value(row, "apellido_nombre")
-        if apellido_nombre_val:
-            texto = apellido_nombre_val.strip()
+        # (las columnas ya vienen stripped y sanitizadas desde _vectorize_frame)
+        texto = row.get("apellido_nombre")
+        if texto:
             if "," in texto:
                 # Formato: "GONZALEZ, JUAN CARLOS"
                 partes = texto.split(",", 1)
-                data["apellido"] = sanitizar_texto(partes[0].strip())
-                data["nombre"] = sanitizar_texto(partes[1].strip()) if len(partes) > 1 and partes[1].strip() else ""
+                data["apellido"] = partes[0].strip()
+                data["nombre"] = partes[1].strip() if len(partes) > 1 else ""
             else:
                 # Formato: "GONZALEZ JUAN CARLOS" — primera palabra = apellido
                 partes = texto.split(None, 1)
-                data["apellido"] = sanitizar_texto(partes[0]) if partes else ""
-                data["nombre"] = sanitizar_texto(partes[1]) if len(partes) > 1 else ""
+                data["apellido"] = partes[0] if partes else ""
+                data["nombre"] = partes[1] if len(partes) > 1 else ""
 
         # Campos de texto
         for field in ("apellido", "nombre", "nacionalidad", "procedencia",
@@ -404,55 +794,45 @@ class ExcelParser:
             # No sobrescribir apellido/nombre si ya se extrajeron del campo combinado
             if field in ("apellido", "nombre") and field in data and data[field]:
                 continue
-            val = self._get_value(row, field)
+            val = row.get(field)
             if val:
-                data[field] = sanitizar_texto(val) if field in (
-                    "apellido", "nombre", "nacionalidad", "procedencia",
-                ) else val.strip()
+                data[field] = val
 
         # Si no tiene apellido ni nombre, no es una fila de datos reales
         if "apellido" not in data and "nombre" not in data:
             return None
 
-        # Documentos — detectar tipo automáticamente
-        dni = self._get_value(row, "dni")
-        pasaporte = self._get_value(row, "pasaporte")
+        # Documentos — clasificación precalculada por _vectorize_frame
+        dni = row.get("dni")
+        pasaporte = row.get("pasaporte")
 
         # Si hay columna combinada DNI/Pasaporte, detectar tipo
+        tiene_doc = False
         if dni and not pasaporte:
-            cleaned = dni.strip().replace(".", "").replace("-", "").replace(" ", "")
-            if cleaned.endswith(".0"):  # Fix float de Excel
-                cleaned = cleaned[:-2]
-            if cleaned.isdigit() and 7 <= len(cleaned) <= 8:
-                data["dni"] = cleaned
-            elif cleaned.isalnum() and 5 <= len(cleaned) <= 15:
-                data["pasaporte"] = cleaned.upper()
+            if row.get("_dni_ok"):
+                data["dni"] = row["_dni_clean"]
+                tiene_doc = True
+            elif row.get("_dni_alnum_ok"):
+                data["pasaporte"] = row["_dni_clean"].upper()
+                tiene_doc = True
         else:
-            if dni:
-                cleaned = dni.strip().replace(".", "").replace("-", "").replace(" ", "")
-                if cleaned.endswith(".0"):
-                    cleaned = cleaned[:-2]
-                if cleaned.isdigit() and 7 <= len(cleaned) <= 8:
-                    data["dni"] = cleaned
-            if pasaporte:
-                cleaned_p = pasaporte.strip().upper().replace(" ", "")
-                if cleaned_p.isalnum() and 5 <= len(cleaned_p) <= 15:
-                    data["pasaporte"] = cleaned_p
-
-        # Fallback: buscar número de 7-8 dígitos en cualquier columna
-        if "dni" not in data and "pasaporte" not in data:
-            for col_name, col_val in row.items():
-                if str(col_name).startswith("_"):
-                    continue
-                val = str(col_val).strip().replace(".", "").replace("-", "").replace(" ", "")
-                if val.endswith(".0"):
-                    val = val[:-2]
-                if val.isdigit() and 7 <= len(val) <= 8:
-                    data["dni"] = val
-                    break
+            if dni and row.get("_dni_ok"):
+                data["dni"] = row["_dni_clean"]
+                tiene_doc = True
+            if pasaporte and row.get("_pas_ok"):
+                data["pasaporte"] = row["_pas_clean"]
+                tiene_doc = True
+
+        # Fallback: número de 7-8 dígitos hallado en cualquier columna,
+        # ya precalculado en bloque por _vectorize_frame
+        if not tiene_doc:
+            fallback_dni = row.get("_fallback_dni")
+            if fallback_dni:
+                data["dni"] = fallback_dni
+                tiene_doc = True
 
         # Validar documento — solo reportar error si tiene AMBOS nombres
-        if "dni" not in data and "pasaporte" not in data:
+        if not tiene_doc:
             if "apellido" in data and "nombre" in data:
                 raise ValueError("Sin documento válido (DNI o Pasaporte)")
             return None  # Fila parcial sin nombres completos ni doc: omitir
@@ -471,7 +851,7 @@ class ExcelParser:
             data["habitacion"] = "S/N"
 
         # Edad
-        edad = self._get_value(row, "edad")
+        edad = row.get("edad")
         if edad:
             try:
                 edad_int = int(float(edad))
@@ -480,19 +860,17 @@ class ExcelParser:
             except (ValueError, TypeError):
                 pass
 
-        # Fecha de nacimiento
-        fecha_nac = self._get_value(row, "fecha_nacimiento")
+        # Fechas: ya parseadas en bloque por _vectorize_frame (claves
+        # internas literales: evita armar el f-string en cada llamada)
+        fecha_nac = self._parsed_date(row, "_fecha_nacimiento_parsed")
         if fecha_nac:
-            parsed_nac = self._parse_date(fecha_nac)
-            if parsed_nac:
-                data["fecha_nacimiento"] = parsed_nac
+            data["fecha_nacimiento"] = fecha_nac
 
-        # Fechas
-        data["fecha_entrada"] = self._parse_date(
-            self._get_value(row, "fecha_entrada"),
-        ) or date.today()
+        data["fecha_entrada"] = (
+            self._parsed_date(row, "_fecha_entrada_parsed") or hoy or date.today()
+        )
 
-        fecha_salida = self._parse_date(self._get_value(row, "fecha_salida"))
+        fecha_salida = self._parsed_date(row, "_fecha_salida_parsed")
         if fecha_salida:
             data["fecha_salida"] = fecha_salida
 
@@ -507,25 +885,30 @@ class ExcelParser:
         return data
 
     @staticmethod
-    def _get_value(row: pd.Series, field: str) -> Optional[str]:
-        """Obtiene un valor de la fila.
+    def _parsed_date(row: dict, key: str) -> Optional[date]:
+        """Lee una fecha precalculada por _vectorize_frame.
 
         Args:
-            row: Serie de datos.
-            field: Nombre del campo.
+            row: Diccionario de datos de la fila.
+            key: Nombre completo de la columna interna (_<campo>_parsed).
 
         Returns:
-            Valor como string o None.
+            Objeto date o None si no hay valor parseado.
         """
-        if field in row.index:
-            val = row[field]
-            if pd.notna(val) and str(val).strip():
-                return str(val).strip()
+        val = row.get(key)
+        if val is not None and pd.notna(val):
+            return val
         return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _parse_date(value: Optional[str]) -> Optional[date]:
-        """Parsea una fecha desde múltiples formatos.
+        """Parsea una fecha escalar desde múltiples formatos.
+
+        Cubre los mismos formatos que _DATE_FORMATS mediante dos regex
+        precompiladas (ISO y día-primero, con mes/día estadounidense
+        como desempate), sin el costo de un strptime fallido por formato.
+        Memoizada: los archivos de importación repiten mucho las fechas.
 
         Args:
             value: String con la fecha.
@@ -533,26 +916,40 @@ class ExcelParser:
         Returns:
             Objeto date o None.
         """
+        if not value:
+            return None
+        value = value.strip()
         if not value:
             return None
 
-        formats = [
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%d-%m-%Y",
-            "%d.%m.%Y",
-            "%m/%d/%Y",
-            "%Y/%m/%d",
-        ]
+        # Día-primero antes que ISO: es el caso dominante y ambos
+        # patrones son disjuntos (4 dígitos al final vs al inicio)
+        m = _FECHA_DMY_RE.fullmatch(value)
+        if m:
+            a, b, anio = int(m[1]), int(m[3]), int(m[4])
+            # Prioridad día/mes (igual que _DATE_FORMATS); si el mes no
+            # es válido se intenta la lectura mes/día
+            for dia, mes in ((a, b), (b, a)):
+                try:
+                    return date(anio, mes, dia)
+                except ValueError:
+                    continue
+            return None
 
-        for fmt in formats:
+        m = _FECHA_ISO_RE.fullmatch(value)
+        if m:
             try:
-                return datetime.strptime(value.strip(), fmt).date()
+                return date(int(m[1]), int(m[3]), int(m[4]))
             except ValueError:
-                continue
+                return None
 
-        # Intentar con pandas
+        # Intentar con pandas (formatos exóticos); pd.to_datetime puede
+        # devolver NaT (truthy) en vez de levantar — mantener el
+        # contrato Optional[date] devolviendo None en ese caso
         try:
-            return pd.to_datetime(value).date()
+            parsed = pd.to_datetime(value)
+            if pd.isna(parsed):
+                return None
+            return parsed.date()
         except Exception:
             return None
@@ -2,15 +2,21 @@
 
 Define una jerarquía de excepciones para manejar errores
 de forma específica y descriptiva en toda la aplicación.
+
+El código y el mensaje por defecto son atributos de clase: construir
+una excepción no paga la reasignación de ``self.code`` por subclase y
+las hojas sin estado extra ni siquiera necesitan definir __init__.
 """
 
 
 class SCAHBaseError(Exception):
     """Excepción base para todas las excepciones del sistema S.C.A.H."""
 
-    def __init__(self, message: str = "Error interno del sistema", code: str = "SCAH_ERROR"):
-        self.message = message
-        self.code = code
+    code: str = "SCAH_ERROR"
+    default_message: str = "Error interno del sistema"
+
+    def __init__(self, message: str | None = None):
+        self.message = message or self.default_message
         super().__init__(self.message)
 
 
@@ -20,24 +26,22 @@ class SCAHBaseError(Exception):
 class DatabaseError(SCAHBaseError):
     """Error relacionado con operaciones de base de datos."""
 
-    def __init__(self, message: str = "Error en la base de datos"):
-        super().__init__(message, "DB_ERROR")
+    code = "DB_ERROR"
+    default_message = "Error en la base de datos"
 
 
 class DatabaseConnectionError(DatabaseError):
     """No se pudo establecer conexión con la base de datos."""
 
-    def __init__(self, message: str = "No se pudo conectar a la base de datos"):
-        super().__init__(message)
-        self.code = "DB_CONNECTION_ERROR"
+    code = "DB_CONNECTION_ERROR"
+    default_message = "No se pudo conectar a la base de datos"
 
 
 class MigrationError(DatabaseError):
     """Error al ejecutar migraciones de base de datos."""
 
-    def __init__(self, message: str = "Error al ejecutar migración"):
-        super().__init__(message)
-        self.code = "DB_MIGRATION_ERROR"
+    code = "DB_MIGRATION_ERROR"
+    default_message = "Error al ejecutar migración"
 
 
 # ============================================================
@@ -46,43 +50,42 @@ class MigrationError(DatabaseError):
 class AuthenticationError(SCAHBaseError):
     """Error de autenticación genérico."""
 
-    def __init__(self, message: str = "Error de autenticación"):
-        super().__init__(message, "AUTH_ERROR")
+    code = "AUTH_ERROR"
+    default_message = "Error de autenticación"
 
 
 class InvalidCredentialsError(AuthenticationError):
     """Credenciales de acceso inválidas."""
 
-    def __init__(self, message: str = "Usuario o contraseña incorrectos"):
-        super().__init__(message)
-        self.code = "AUTH_INVALID_CREDENTIALS"
+    code = "AUTH_INVALID_CREDENTIALS"
+    default_message = "Usuario o contraseña incorrectos"
 
 
 class AccountLockedError(AuthenticationError):
     """Cuenta bloqueada por exceso de intentos fallidos."""
 
-    def __init__(self, message: str = "Cuenta bloqueada temporalmente", minutes_remaining: int = 0):
+    code = "AUTH_ACCOUNT_LOCKED"
+    default_message = "Cuenta bloqueada temporalmente"
+
+    def __init__(self, message: str | None = None, minutes_remaining: int = 0):
         self.minutes_remaining = minutes_remaining
         if minutes_remaining > 0:
             message = f"Cuenta bloqueada. Intente nuevamente en {minutes_remaining} minutos"
         super().__init__(message)
-        self.code = "AUTH_ACCOUNT_LOCKED"
 
 
 class AccountDisabledError(AuthenticationError):
     """Cuenta de usuario deshabilitada."""
 
-    def __init__(self, message: str = "Cuenta deshabilitada. Contacte al administrador"):
-        super().__init__(message)
-        self.code = "AUTH_ACCOUNT_DISABLED"
+    code = "AUTH_ACCOUNT_DISABLED"
+    default_message = "Cuenta deshabilitada. Contacte al administrador"
 
 
 class UserNotFoundError(AuthenticationError):
     """Usuario no encontrado en el sistema."""
 
-    def __init__(self, message: str = "Usuario no encontrado"):
-        super().__init__(message)
-        self.code = "AUTH_USER_NOT_FOUND"
+    code = "AUTH_USER_NOT_FOUND"
+    default_message = "Usuario no encontrado"
 
 
 # ============================================================
@@ -91,19 +94,21 @@ class UserNotFoundError(AuthenticationError):
 class ValidationError(SCAHBaseError):
     """Error de validación de datos."""
 
-    def __init__(self, message: str = "Datos inválidos", field: str = ""):
+    code = "VALIDATION_ERROR"
+    default_message = "Datos inválidos"
+
+    def __init__(self, message: str | None = None, field: str = ""):
         self.field = field
         if field:
-            message = f"Campo '{field}': {message}"
-        super().__init__(message, "VALIDATION_ERROR")
+            message = f"Campo '{field}': {message or self.default_message}"
+        super().__init__(message)
 
 
 class DuplicateRecordError(ValidationError):
     """Registro duplicado en la base de datos."""
 
-    def __init__(self, message: str = "El registro ya existe", field: str = ""):
-        super().__init__(message, field)
-        self.code = "VALIDATION_DUPLICATE"
+    code = "VALIDATION_DUPLICATE"
+    default_message = "El registro ya existe"
 
 
 # ============================================================
@@ -112,28 +117,33 @@ class DuplicateRecordError(ValidationError):
 class ImportFileError(SCAHBaseError):
     """Error durante la importación masiva de datos."""
 
-    def __init__(self, message: str = "Error durante la importación"):
-        super().__init__(message, "IMPORT_ERROR")
+    code = "IMPORT_ERROR"
+    default_message = "Error durante la importación"
 
 
 class InvalidFileFormatError(ImportFileError):
     """Formato de archivo no soportado."""
 
-    def __init__(self, message: str = "Formato de archivo no válido"):
-        super().__init__(message)
-        self.code = "IMPORT_INVALID_FORMAT"
+    code = "IMPORT_INVALID_FORMAT"
+    default_message = "Formato de archivo no válido"
 
 
 class MissingColumnsError(ImportFileError):
     """Columnas requeridas faltantes en el archivo."""
 
-    def __init__(self, message: str = "Faltan columnas requeridas", missing: list[str] | None = None):
-        self.missing_columns = missing or []
-        if missing:
-            cols = ", ".join(missing)
-            message = f"Columnas faltantes: {cols}"
+    code = "IMPORT_MISSING_COLUMNS"
+    default_message = "Faltan columnas requeridas"
+
+    def __init__(self, message: str | None = None, missing: list[str] | None = None):
+        # Tupla inmutable y join diferido a __str__: levantar la
+        # excepción no paga el formateo, solo quien la muestra
+        self.missing_columns: tuple[str, ...] = tuple(missing) if missing else ()
         super().__init__(message)
-        self.code = "IMPORT_MISSING_COLUMNS"
+
+    def __str__(self) -> str:
+        if self.missing_columns:
+            return f"Columnas faltantes: {', '.join(self.missing_columns)}"
+        return self.message
 
 
 # ============================================================
@@ -142,5 +152,5 @@ class MissingColumnsError(ImportFileError):
 class PermissionDeniedError(SCAHBaseError):
     """Acción no permitida para el rol del usuario."""
 
-    def __init__(self, message: str = "No tiene permisos para realizar esta acción"):
-        super().__init__(message, "PERMISSION_DENIED")
+    code = "PERMISSION_DENIED"
+    default_message = "No tiene permisos para realizar esta acción"
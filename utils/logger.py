@@ -4,9 +4,11 @@ Configura un logger con salida a consola y archivo rotativo.
 Todos los módulos deben usar este sistema para sus logs.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from config.settings import (
     LOG_BACKUP_COUNT,
@@ -36,13 +38,18 @@ def setup_logger(name: str = "scah", level: int = logging.DEBUG) -> logging.Logg
     logger.setLevel(level)
     formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
-    # Handler de consola
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    # Handler de archivo rotativo
+    # Handler de consola: solo con una terminal adjunta. Cuando la app
+    # corre como GUI sin consola, cada log pagaría el write/flush a un
+    # stdout que nadie lee
+    if sys.stdout is not None and sys.stdout.isatty():
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+
+    # Handler de archivo rotativo, detrás de una cola: el hilo que
+    # loguea solo encola el registro y la E/S (incluida la rotación)
+    # corre en el hilo del QueueListener, fuera del camino caliente
     try:
         file_handler = RotatingFileHandler(
             filename=str(LOG_FILE),
@@ -52,13 +59,28 @@ def setup_logger(name: str = "scah", level: int = logging.DEBUG) -> logging.Logg
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
     except (OSError, PermissionError) as e:
         logger.warning("No se pudo crear el archivo de log: %s", e)
 
     return logger
 
 
+# Logger raíz configurado una sola vez al importar el módulo; cada
+# get_logger posterior se reduce a un lookup de dict local en lugar de
+# repasar setup_logger y el manager global de logging
+_ROOT: logging.Logger = setup_logger("scah")
+_CHILDREN: dict[str, logging.Logger] = {}
+
+
 def get_logger(module_name: str) -> logging.Logger:
     """Obtiene un logger hijo del logger principal.
 
@@ -68,5 +90,8 @@ def get_logger(module_name: str) -> logging.Logger:
     Returns:
         Logger configurado como hijo del logger principal 'scah'.
     """
-    parent_logger = setup_logger("scah")
-    return parent_logger.getChild(module_name)
+    try:
+        return _CHILDREN[module_name]
+    except KeyError:
+        child = _CHILDREN.setdefault(module_name, _ROOT.getChild(module_name))
+        return child
@@ -15,6 +15,22 @@ from utils.logger import get_logger
 
 logger = get_logger("components.data_table")
 
+# El estilo del Treeview es estado global de Tk: configurarlo una vez
+# por proceso evita repetir las llamadas Tcl (y la re-resolución de
+# estilos) en cada tabla que se instancia
+_STYLE_INSTALLED: bool = False
+
+
+def _install_style() -> None:
+    """Configura el estilo global del Treeview una sola vez por proceso."""
+    global _STYLE_INSTALLED
+    if _STYLE_INSTALLED:
+        return
+    style = ttk.Style()
+    style.configure("Treeview", rowheight=28, font=("Segoe UI", 10))
+    style.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"))
+    _STYLE_INSTALLED = True
+
 
 class DataTable(ctk.CTkFrame):
     """Tabla de datos con ordenamiento, paginación y selección."""
@@ -58,6 +74,10 @@ class DataTable(ctk.CTkFrame):
             else:
                 raise ValueError(f"Formato de columna inválido: {col}")
 
+        # Keys de columna fijadas una sola vez; se reutilizan en el
+        # refresco de página y en get_selected
+        self._col_keys: tuple[str, ...] = tuple(col["key"] for col in self._columns)
+
         self._on_select = on_select
         self._on_double_click = on_double_click
         self._page_size = page_size
@@ -77,12 +97,10 @@ class DataTable(ctk.CTkFrame):
         table_frame = ctk.CTkFrame(self, fg_color="transparent")
         table_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
-        col_keys = [col["key"] for col in self._columns]
+        col_keys = self._col_keys
 
-        # Estilo del Treeview
-        style = ttk.Style()
-        style.configure("Treeview", rowheight=28, font=("Segoe UI", 10))
-        style.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"))
+        # Estilo del Treeview (global, instalado una sola vez)
+        _install_style()
 
         self._tree = ttk.Treeview(
             table_frame,
@@ -170,22 +188,41 @@ class DataTable(ctk.CTkFrame):
         self._refresh_display()
 
     def _refresh_display(self) -> None:
-        """Refresca la tabla mostrando la página actual."""
-        # Limpiar tabla
-        for item in self._tree.get_children():
-            self._tree.delete(item)
-
-        # Calcular rango de datos para la página
+        """Refresca la tabla mostrando la página actual.
+
+        Reutiliza los items ya creados del Treeview actualizando sus
+        valores con item() en lugar de borrar y reinsertar todas las
+        filas: insert es la operación cara del widget y en un cambio de
+        página normal la cantidad de filas no varía, así que solo se
+        crean o eliminan items cuando la página queda corta (última
+        página, filtros).
+        """
         start = (self._current_page - 1) * self._page_size
         end = start + self._page_size
         page_data = self._all_data[start:end]
 
-        # Insertar filas
-        col_keys = [col["key"] for col in self._columns]
-        for i, row_data in enumerate(page_data):
+        tree = self._tree
+        items = list(tree.get_children())
+
+        # Ajustar el pool de items a la cantidad de filas de la página
+        faltan = len(page_data) - len(items)
+        if faltan > 0:
+            items.extend(tree.insert("", "end") for _ in range(faltan))
+        elif faltan < 0:
+            tree.delete(*items[len(page_data):])
+            del items[len(page_data):]
+
+        # La selección previa apuntaría a un item con datos nuevos;
+        # limpiarla reproduce el efecto del viejo delete+insert
+        if tree.selection():
+            tree.selection_remove(*tree.selection())
+
+        # dict.get por celda pero solo sobre la página visible (O(página),
+        # no O(dataset)); las filas son dicts del llamador y no se mutan
+        col_keys = self._col_keys
+        for i, (iid, row_data) in enumerate(zip(items, page_data)):
             values = [row_data.get(key, "") for key in col_keys]
-            tag = "odd" if i % 2 else "even"
-            self._tree.insert("", "end", values=values, tags=(tag,))
+            tree.item(iid, values=values, tags=("odd" if i % 2 else "even",))
 
         # Actualizar paginación
         self._update_pagination()
@@ -260,9 +297,7 @@ class DataTable(ctk.CTkFrame):
             return None
 
         item = self._tree.item(selection[0])
-        values = item["values"]
-        col_keys = [col["key"] for col in self._columns]
-        return dict(zip(col_keys, values))
+        return dict(zip(self._col_keys, item["values"]))
 
     def clear(self) -> None:
         """Limpia todos los datos de la tabla."""